@@ -50,6 +50,23 @@ class IdHashBox:
 CANONICAL_PARSE_CACHE_SIZE = 4096
 
 
+@lru_cache(maxsize=None)
+def _class_defines_attr(cls: type, attr: str) -> bool:
+    """Check whether a class defines the given attribute.
+
+    Class bodies don't change at runtime, so the result is cached to avoid
+    repeating the MRO walk for every attribute set on every instance.
+
+    Args:
+        cls: The class to check.
+        attr: The attribute name to look up.
+
+    Returns:
+        Whether the class defines the attribute.
+    """
+    return hasattr(cls, attr)  # noqa: WPS421
+
+
 class Annotations(t.NamedTuple):
     """Tuple storing the data of an annotation, and its index."""
 
@@ -171,6 +188,11 @@ class Canonical(metaclass=AnnotationsMeta):  # noqa: WPS214 (too many methods)
                 return as_commented_seq
             return as_list
 
+        # Scalar leaves are immutable and account for nearly all values that
+        # reach this point, so skip the deepcopy machinery for them
+        if target is None or isinstance(target, (str, int, float, bool, bytes)):
+            return target
+
         return copy.deepcopy(target)
 
     def canonical(self) -> dict | list | CommentedMap | CommentedSeq | t.Any:
@@ -292,7 +314,7 @@ class Canonical(metaclass=AnnotationsMeta):  # noqa: WPS214 (too many methods)
             attr: Attribute to set.
             value: Value to set.
         """
-        if attr.startswith("_") or hasattr(type(self), attr):  # noqa: WPS421
+        if attr.startswith("_") or _class_defines_attr(type(self), attr):
             super().__setattr__(attr, value)
         else:
             self._dict[attr] = value
@@ -428,3 +450,6 @@ class Canonical(metaclass=AnnotationsMeta):  # noqa: WPS214 (too many methods)
 
 
 yaml.add_multi_representer(Canonical, Canonical.yaml)
+yaml.add_multi_representer(Canonical, Canonical.yaml, Dumper=yaml.SafeDumper)
+if getattr(yaml, "CSafeDumper", yaml.SafeDumper) is not yaml.SafeDumper:
+    yaml.add_multi_representer(Canonical, Canonical.yaml, Dumper=yaml.CSafeDumper)
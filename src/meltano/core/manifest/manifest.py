@@ -68,6 +68,11 @@ PluginsByType: TypeAlias = t.Mapping[str, t.List[t.Mapping[str, t.Any]]]
 PluginsByNameByType: TypeAlias = t.Mapping[str, t.Mapping[str, t.Mapping[str, t.Any]]]
 
 
+# Use libyaml's C loader when available - parsing is several times faster than
+# with the pure-Python loader, and the fallback keeps behavior identical.
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 # Ruamel doesn't have this problem where YAML tags like timestamps are
 # automatically converted to Python objects that aren't JSON-serializable, but
 # it's not suitable for use here because it doesn't load the YAML file as plain
@@ -85,24 +90,24 @@ class YamlLimitedSafeLoader(type):
         Args:
             name: The name of the new class.
             bases: The base classes of the new class. The first base class will
-                always be `yaml.SafeLoader`. These will come afterwards.
+                always be the safe loader. These will come afterwards.
             namespace: The namespace of the new class.
             do_not_resolve: The YAML tags whose resolution should be skipped
                 during parsing. They will be left as raw strings.
 
         Returns:
-            The new class object, which is a subclass of `yaml.SafeLoader`
+            The new class object, which is a subclass of the safe loader
             which skips the resolution of the specified YAML tags.
         """
         do_not_resolve = set(do_not_resolve)
         implicit_resolvers = {
             key: [(tag, regex) for tag, regex in mappings if tag not in do_not_resolve]
-            for key, mappings in yaml.SafeLoader.yaml_implicit_resolvers.items()
+            for key, mappings in _SafeLoader.yaml_implicit_resolvers.items()
         }
         return super().__new__(
             cls,
             name,
-            (yaml.SafeLoader, *bases),
+            (_SafeLoader, *bases),
             {**namespace, "yaml_implicit_resolvers": implicit_resolvers},
         )
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import re
+from functools import lru_cache
 
 import yaml
 
@@ -14,10 +15,12 @@ from meltano.core.job_state import STATE_ID_COMPONENT_DELIMITER
 from meltano.core.plugin.command import Command
 from meltano.core.plugin.requirements import PluginRequirement
 from meltano.core.setting_definition import SettingDefinition, YAMLEnum
-from meltano.core.utils import NotFound, find_named
+from meltano.core.utils import NotFound, find_named, flatten
 
 logger = logging.getLogger(__name__)
 
+_TAP_TARGET_PREFIX_RE = re.compile(r"^(?:tap|target)-")
+
 
 class VariantNotFoundError(Exception):
     """Raised when a variant is not found."""
@@ -60,7 +63,16 @@ class PluginRefNameContainsStateIdDelimiterError(Exception):
         )
 
 
+# Use libyaml's C dumper when available - it is significantly faster than the
+# pure-Python one, and falls back transparently when PyYAML was built without it.
+CSafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 yaml.add_multi_representer(YAMLEnum, YAMLEnum.yaml_representer)
+yaml.add_multi_representer(
+    YAMLEnum, YAMLEnum.yaml_representer, Dumper=yaml.SafeDumper
+)
+if CSafeDumper is not yaml.SafeDumper:
+    yaml.add_multi_representer(YAMLEnum, YAMLEnum.yaml_representer, Dumper=CSafeDumper)
 
 
 class PluginType(YAMLEnum):  # noqa: WPS214
@@ -91,10 +103,7 @@ class PluginType(YAMLEnum):  # noqa: WPS214
         Returns:
             The descriptor of the plugin type.
         """
-        if self is self.__class__.FILES:
-            return "file bundle"
-
-        return self.singular
+        return self._descriptor
 
     @property
     def singular(self) -> str:
@@ -103,10 +112,7 @@ class PluginType(YAMLEnum):  # noqa: WPS214
         Returns:
             The singular form of the plugin type.
         """
-        if self is self.__class__.UTILITIES:
-            return "utility"
-
-        return self.value[:-1]
+        return self._singular
 
     @property
     def verb(self) -> str:
@@ -115,14 +121,7 @@ class PluginType(YAMLEnum):  # noqa: WPS214
         Returns:
             The verb form of the plugin type.
         """
-        if self is self.__class__.TRANSFORMS:
-            return self.singular
-        if self is self.__class__.UTILITIES:
-            return "utilize"
-        if self is self.__class__.MAPPERS:
-            return "map"
-
-        return self.value[:-3]
+        return self._verb
 
     @property
     def discoverable(self) -> bool:
@@ -134,6 +133,7 @@ class PluginType(YAMLEnum):  # noqa: WPS214
         return self is not self.__class__.MAPPINGS
 
     @classmethod
+    @lru_cache(maxsize=None)
     def value_exists(cls, value: str) -> bool:
         """Check if a plugin type exists.
 
@@ -146,6 +146,7 @@ class PluginType(YAMLEnum):  # noqa: WPS214
         return value in cls._value2member_map_
 
     @classmethod
+    @lru_cache(maxsize=None)
     def cli_arguments(cls) -> list:
         """Return the list of plugin types that can be used as CLI arguments.
 
@@ -159,6 +160,7 @@ class PluginType(YAMLEnum):  # noqa: WPS214
         ]
 
     @classmethod
+    @lru_cache(maxsize=None)
     def from_cli_argument(cls, value: str) -> PluginType:
         """Get the plugin type from a CLI argument.
 
@@ -187,6 +189,27 @@ class PluginType(YAMLEnum):  # noqa: WPS214
         return [plugin_type.value for plugin_type in cls]
 
 
+# The singular, verb, and descriptor forms are constant per member, so they
+# are computed once at import time instead of on every property access.
+for _plugin_type in PluginType:
+    _plugin_type._singular = (  # noqa: WPS437
+        "utility" if _plugin_type is PluginType.UTILITIES else _plugin_type.value[:-1]
+    )
+
+    if _plugin_type is PluginType.TRANSFORMS:
+        _plugin_type._verb = _plugin_type._singular  # noqa: WPS437
+    elif _plugin_type is PluginType.UTILITIES:
+        _plugin_type._verb = "utilize"  # noqa: WPS437
+    elif _plugin_type is PluginType.MAPPERS:
+        _plugin_type._verb = "map"  # noqa: WPS437
+    else:
+        _plugin_type._verb = _plugin_type.value[:-3]  # noqa: WPS437
+
+    _plugin_type._descriptor = (  # noqa: WPS437
+        "file bundle" if _plugin_type is PluginType.FILES else _plugin_type._singular
+    )
+
+
 class PluginRef(Canonical):
     """A reference to a plugin."""
 
@@ -209,6 +232,9 @@ class PluginRef(Canonical):
             if isinstance(plugin_type, PluginType)
             else PluginType(plugin_type)
         )
+        # The type and name identify the plugin and don't change, so the
+        # hash is computed once up front
+        self._hash = hash((self._type, name))
 
         super().__init__(name=name, **kwargs)
 
@@ -230,7 +256,9 @@ class PluginRef(Canonical):
         Returns:
             True if the plugin references are equal, False otherwise.
         """
-        return self.name == other.name and self.type == other.type
+        return self is other or (
+            self.name == other.name and self.type == other.type
+        )
 
     def __hash__(self) -> int:
         """Return the hash of the plugin reference.
@@ -238,7 +266,7 @@ class PluginRef(Canonical):
         Returns:
             The hash of the plugin reference.
         """
-        return hash((self.type, self.name))
+        return self._hash
 
     def set_presentation_attrs(self, extras):
         """Set the presentation attributes of the plugin reference.
@@ -255,7 +283,12 @@ class PluginRef(Canonical):
 
 
 class Variant(NameEq, Canonical):
-    """A variant of a plugin."""
+    """A variant of a plugin.
+
+    Instances must not be interned or shared across plugin definitions:
+    they are mutated after construction (e.g. `extras` is moved onto the
+    plugin definition when a variant is implicit).
+    """
 
     ORIGINAL_NAME = "original"
     DEFAULT_NAME = "default"
@@ -309,9 +342,22 @@ class Variant(NameEq, Canonical):
             executable=executable,
             description=description,
             logo_url=logo_url,
-            capabilities=list(capabilities or []),
-            settings_group_validation=list(settings_group_validation or []),
-            settings=list(map(SettingDefinition.parse, settings or [])),
+            capabilities=(
+                capabilities
+                if isinstance(capabilities, list)
+                else list(capabilities or [])
+            ),
+            settings_group_validation=(
+                settings_group_validation
+                if isinstance(settings_group_validation, list)
+                else list(settings_group_validation or [])
+            ),
+            settings=[
+                setting
+                if isinstance(setting, SettingDefinition)
+                else SettingDefinition.parse(setting)
+                for setting in settings or []
+            ],
             commands=Command.parse_all(commands),
             requires=PluginRequirement.parse_all(requires),
             env=env or {},
@@ -346,12 +392,16 @@ class PluginDefinition(PluginRef):
         self._defaults["label"] = lambda plugin: plugin.name
 
         def default_logo_url(plugin_def):
-            short_name = re.sub(
-                r"^(tap|target)-",  # noqa: WPS360
-                "",
-                plugin_def.name,
-            )
-            return f"/static/logos/{short_name}-logo.png"
+            # The name is stable for a given plugin definition, so the
+            # computed URL is stored on first use.
+            try:
+                return plugin_def._cached_logo_url  # noqa: WPS437
+            except AttributeError:
+                short_name = _TAP_TARGET_PREFIX_RE.sub("", plugin_def.name)
+                plugin_def._cached_logo_url = (  # noqa: WPS437
+                    f"/static/logos/{short_name}-logo.png"
+                )
+                return plugin_def._cached_logo_url  # noqa: WPS437
 
         self._defaults["logo_url"] = default_logo_url
 
@@ -370,13 +420,27 @@ class PluginDefinition(PluginRef):
         self.set_presentation_attrs(extras)
         self.extras = extras
         self.variants = list(map(Variant.parse, variants))
+        self._variants_by_name = {variant.name: variant for variant in self.variants}
+        self._original_variant = next(
+            (variant for variant in self.variants if variant.original),
+            self.variants[0],
+        )
 
     def __iter__(self):
-        """Iterate over the variants of the plugin definition.
+        """Iterate over the attributes of the plugin definition.
 
-        Yields:
-            The variants of the plugin definition.
+        Returns:
+            An iterator over the attributes of the plugin definition.
+        """
+        return iter(self._build_items())
+
+    def _build_items(self) -> list[tuple]:
+        """Build the list of attributes of the plugin definition.
+
+        Returns:
+            The attributes of the plugin definition as key-value pairs.
         """
+        items = []
         for attr, value in super().__iter__():
             if attr == "variants" and len(value) == 1:
                 # If there is only a single variant, its properties can be
@@ -385,9 +449,11 @@ class PluginDefinition(PluginRef):
                     if variant_k == "name":
                         variant_k = "variant"
 
-                    yield (variant_k, variant_v)
+                    items.append((variant_k, variant_v))
             else:
-                yield (attr, value)
+                items.append((attr, value))
+
+        return items
 
     def get_variant(self, variant_name: str) -> Variant:
         """Get the variant with the given name.
@@ -402,9 +468,17 @@ class PluginDefinition(PluginRef):
             VariantNotFoundError: If the variant is not found.
         """
         try:
-            return find_named(self.variants, variant_name)
-        except NotFound as err:
-            raise VariantNotFoundError(self, variant_name) from err
+            return self._variants_by_name[variant_name]
+        except KeyError:
+            # The variants list may have been modified since construction,
+            # so fall back to a scan before giving up.
+            try:
+                variant = find_named(self.variants, variant_name)
+            except NotFound as err:
+                raise VariantNotFoundError(self, variant_name) from err
+
+            self._variants_by_name[variant_name] = variant
+            return variant
 
     def find_variant(self, variant_or_name: str | Variant | None = None):
         """Find the variant with the given name or variant.
@@ -422,10 +496,7 @@ class PluginDefinition(PluginRef):
             return self.variants[0]
 
         if variant_or_name == Variant.ORIGINAL_NAME:
-            try:
-                return next(variant for variant in self.variants if variant.original)
-            except StopIteration:
-                return self.variants[0]
+            return self._original_variant
 
         return self.get_variant(variant_or_name)
 
@@ -509,6 +580,7 @@ class BasePlugin(HookObject):  # noqa: WPS214
 
         self._plugin_def = plugin_def
         self._variant = variant
+        self._attr_chain = (plugin_def, variant)
 
     def __eq__(self, other: BasePlugin):
         """Compare two plugins.
@@ -548,11 +620,54 @@ class BasePlugin(HookObject):  # noqa: WPS214
 
         Returns:
             The value of the setting.
+
+        Raises:
+            AttributeError: If the attribute is not found on the plugin
+                definition or the variant.
         """
-        try:
-            return getattr(self._plugin_def, attr)
-        except AttributeError:
-            return getattr(self._variant, attr)
+        for source in self._attr_chain:
+            try:
+                return getattr(source, attr)
+            except AttributeError:
+                continue
+
+        raise AttributeError(attr)
+
+    @property
+    def name(self) -> str:
+        """Return the plugin name.
+
+        Returns:
+            The plugin name.
+        """
+        return self._plugin_def.name
+
+    @property
+    def namespace(self) -> str:
+        """Return the plugin namespace.
+
+        Returns:
+            The plugin namespace.
+        """
+        return self._plugin_def.namespace
+
+    @property
+    def pip_url(self) -> str | None:
+        """Return the plugin pip URL.
+
+        Returns:
+            The pip URL.
+        """
+        return self._variant.pip_url
+
+    @property
+    def capabilities(self) -> list:
+        """Return the plugin capabilities.
+
+        Returns:
+            The capabilities.
+        """
+        return self._variant.capabilities
 
     @property
     def variant(self) -> str:
@@ -622,7 +737,10 @@ class BasePlugin(HookObject):  # noqa: WPS214
         defaults = {f"_{name}": value for name, value in self.extras.items()}
 
         existing_settings = []
+        known_names = set()
         for setting in self.EXTRA_SETTINGS:
+            known_names.add(setting.name)
+
             default_value = defaults.get(setting.name)
             if default_value is not None:
                 setting = setting.with_attrs(value=default_value)
@@ -632,9 +750,9 @@ class BasePlugin(HookObject):  # noqa: WPS214
         # Create setting definitions for unknown defaults,
         # including flattened keys of default nested object items
         existing_settings.extend(
-            SettingDefinition.from_missing(
-                existing_settings, defaults, custom=False, default=True
-            )
+            SettingDefinition.from_key_value(key, value, custom=False, default=True)
+            for key, value in flatten(defaults, "dot").items()
+            if key not in known_names
         )
 
         return existing_settings
@@ -801,7 +919,12 @@ class StandalonePlugin(Canonical):
             logo_url=logo_url,
             capabilities=capabilities or [],
             settings_group_validation=settings_group_validation or [],
-            settings=list(map(SettingDefinition.parse, settings or [])),
+            settings=[
+                setting
+                if isinstance(setting, SettingDefinition)
+                else SettingDefinition.parse(setting)
+                for setting in settings or []
+            ],
             commands=Command.parse_all(commands),
             requires=PluginRequirement.parse_all(requires),
             env=env or {},
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import fnmatch
 import logging
+import os
 import re
 import typing as t
 from collections import OrderedDict
 from enum import Enum, auto
-from functools import singledispatch
+from functools import lru_cache, singledispatch
 
 from meltano.core.behavior.visitor import visit_with
 
@@ -14,6 +14,25 @@ Node = t.Dict[str, t.Any]
 T = t.TypeVar("T", bound="CatalogRule")
 
 
+@lru_cache(maxsize=None)
+def _compile_patterns(patterns: tuple[str, ...]) -> re.Pattern:
+    """Compile a union of `fnmatch` patterns into a single regex.
+
+    Args:
+        patterns: The `fnmatch`-style patterns to compile.
+
+    Returns:
+        A compiled regex that matches when any of the patterns match.
+    """
+    # Deferred so importing this module doesn't pay for `fnmatch`; results
+    # are cached, so the import cost is only paid on the first compile
+    import fnmatch  # noqa: WPS433
+
+    return re.compile(
+        "|".join(fnmatch.translate(os.path.normcase(pattern)) for pattern in patterns)
+    )
+
+
 class CatalogRule:
     def __init__(
         self,
@@ -47,12 +66,16 @@ class CatalogRule:
             A boolean representing whether the stream ID or breadcrumb matches the rules.
         """
         patterns = (
-            self.tap_stream_id
+            tuple(self.tap_stream_id)
             if isinstance(self.tap_stream_id, list)
-            else [self.tap_stream_id]
+            else (self.tap_stream_id,)
         )
 
-        result = any(fnmatch.fnmatch(tap_stream_id, pattern) for pattern in patterns)
+        # All patterns are matched with a single pre-compiled union regex
+        # instead of one `fnmatch` call per pattern
+        result = bool(patterns) and bool(
+            _compile_patterns(patterns).match(os.path.normcase(tap_stream_id))
+        )
 
         # A negated rule matches a stream ID when none of the patterns match
         if self.negated:
@@ -60,8 +83,10 @@ class CatalogRule:
 
         # If provided, the breadcrumb should still match, even on negated rules
         if breadcrumb is not None:
-            result = result and fnmatch.fnmatch(
-                ".".join(breadcrumb), ".".join(self.breadcrumb)
+            result = result and bool(
+                _compile_patterns((".".join(self.breadcrumb),)).match(
+                    os.path.normcase(".".join(breadcrumb))
+                )
             )
 
         return result
@@ -460,6 +485,8 @@ class SchemaExecutor(CatalogExecutor):
 
     def ensure_property(self, breadcrumb: list[str]):  # noqa: WPS231
         """Create nodes for the breadcrumb and schema extra that matches."""
+        import fnmatch  # noqa: WPS433
+
         next_node: dict[str, t.Any] = self._stream["schema"]
 
         for idx, key in enumerate(breadcrumb):
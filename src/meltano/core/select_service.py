@@ -1,6 +1,20 @@
 from __future__ import annotations
 
-import json
+from functools import cached_property
+from io import BytesIO
+
+try:
+    # `orjson` parses large catalogs several times faster than stdlib `json`
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+try:
+    # `ijson` allows walking the catalog stream by stream without ever
+    # materializing the full parsed tree in memory
+    import ijson
+except ImportError:
+    ijson = None
 
 from meltano.core.plugin import PluginType
 from meltano.core.plugin.base import PluginRef
@@ -24,30 +38,47 @@ class SelectService:
         self._extractor = self.project.plugins.find_plugin(
             extractor, PluginType.EXTRACTORS
         )
+        self._settings_service = PluginSettingsService(self.project, self._extractor)
 
     @property
     def extractor(self) -> ProjectPlugin:
         """Retrieve extractor ProjectPlugin object."""
         return self._extractor
 
-    @property
+    @cached_property
     def current_select(self):
-        plugin_settings_service = PluginSettingsService(self.project, self.extractor)
-        return plugin_settings_service.get("_select")
+        """Return the current select patterns, cached per service instance."""
+        return self._settings_service.get("_select")
 
-    async def load_catalog(self, session):
-        """Load the catalog."""
+    def invalidate(self) -> None:
+        """Invalidate the cached select patterns after they were updated."""
+        self.__dict__.pop("current_select", None)
+
+    async def _dump_catalog(self, session) -> str:
+        """Dump the catalog file contents."""
         invoker = invoker_factory(self.project, self.extractor)
 
         async with invoker.prepared(session):
-            catalog_json = await invoker.dump("catalog")
+            return await invoker.dump("catalog")
 
-        return json.loads(catalog_json)
+    async def load_catalog(self, session):
+        """Load the catalog."""
+        return _json_loads(await self._dump_catalog(session))
 
     async def list_all(self, session) -> ListSelectedExecutor:
         """List all select."""
+        list_all = ListSelectedExecutor()
+
         try:
-            catalog = await self.load_catalog(session)
+            if ijson is None:
+                list_all.visit(await self.load_catalog(session))
+            else:
+                # Visit one stream entry at a time so only a single parsed
+                # stream subtree is held in memory at once
+                catalog_json = await self._dump_catalog(session)
+                catalog_bytes = BytesIO(catalog_json.encode())
+                for stream in ijson.items(catalog_bytes, "streams.item"):
+                    list_all.visit({"streams": [stream]})
         except FileNotFoundError as err:
             raise PluginExecutionError(
                 "Could not find catalog. Verify that the tap supports discovery "
@@ -55,9 +86,6 @@ class SelectService:
                 + "`catalog` or `properties`"
             ) from err
 
-        list_all = ListSelectedExecutor()
-        list_all.visit(catalog)
-
         return list_all
 
     def update(self, entities_filter, attributes_filter, exclude, remove=False):
@@ -76,7 +104,9 @@ class SelectService:
         )
         patterns = plugin.extras.get("select", [])
         if remove:
-            patterns.remove(this_pattern)
+            # Rebuild the list instead of using `list.remove`, which performs
+            # a linear scan and raises `ValueError` if the pattern is absent
+            patterns = [pattern for pattern in patterns if pattern != this_pattern]
         else:
             patterns.append(this_pattern)
         plugin.extras["select"] = patterns
@@ -86,6 +116,8 @@ class SelectService:
         else:
             self.project.plugins.update_environment_plugin(plugin)
 
+        self.invalidate()
+
     @staticmethod
     def _get_pattern_string(entities_filter, attributes_filter, exclude) -> str:
         """Return a select pattern in string form."""
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from meltano.core import select_service
+from meltano.core.select_service import SelectService
+
+CATALOG = {
+    "streams": [
+        {
+            "tap_stream_id": "users",
+            "stream": "users",
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "integer"},
+                    "name": {"type": "string"},
+                },
+            },
+            "metadata": [
+                {"breadcrumb": [], "metadata": {"selected": True}},
+                {
+                    "breadcrumb": ["properties", "id"],
+                    "metadata": {"inclusion": "automatic"},
+                },
+                {
+                    "breadcrumb": ["properties", "name"],
+                    "metadata": {"selected": True},
+                },
+            ],
+        },
+        {
+            "tap_stream_id": "orders",
+            "stream": "orders",
+            "schema": {
+                "type": "object",
+                "properties": {"total": {"type": "number"}},
+            },
+            "metadata": [
+                {"breadcrumb": [], "metadata": {"selected": False}},
+                {
+                    "breadcrumb": ["properties", "total"],
+                    "metadata": {"selected": False},
+                },
+            ],
+        },
+    ],
+}
+
+
+class TestSelectService:
+    @pytest.fixture
+    def subject(self, project, tap):
+        return SelectService(project, tap.name)
+
+    @pytest.mark.asyncio
+    async def test_list_all_streaming_matches_full_parse(
+        self, subject, session, monkeypatch
+    ):
+        catalog_json = json.dumps(CATALOG)
+
+        async def dump_catalog(dump_session):
+            return catalog_json
+
+        monkeypatch.setattr(subject, "_dump_catalog", dump_catalog)
+
+        streamed = await subject.list_all(session)
+
+        # Force the whole-catalog fallback path and compare
+        monkeypatch.setattr(select_service, "ijson", None)
+        full = await subject.list_all(session)
+
+        assert streamed.streams == full.streams
+        assert streamed.properties == full.properties
+        assert streamed.selected_properties == full.selected_properties
+        assert streamed.selected_properties == {"users": {"id", "name"}}